@@ -38,8 +38,17 @@ Linux and run the above setup command.
 Environment variables
 =====================
 
+.. envvar:: NEXTSTRAIN_CONDA_KEEP_PKGS
+
+    If set to a non-empty value, Micromamba's package cache is kept after
+    setup and update instead of being cleaned up, and is carried over when
+    ``nextstrain setup --force`` replaces the Micromamba installation.  This
+    uses more disk space but lets subsequent updates and forced setups reuse
+    already downloaded packages instead of downloading them again.
+
 .. warning::
-    For development only.  You don't need to set these during normal operation.
+    The variables below are for development only.  You don't need to set these
+    during normal operation.
 
 .. envvar:: NEXTSTRAIN_CONDA_CHANNEL
 
@@ -70,6 +79,7 @@ Environment variables
     Defaults to ``1.5.8``.
 """
 
+import hashlib
 import json
 import os
 import platform
@@ -79,11 +89,13 @@ import shutil
 import subprocess
 import tarfile
 import traceback
-from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from packaging.version import Version, InvalidVersion
 from pathlib import Path, PurePosixPath
-from typing import Iterable, NamedTuple, Optional
-from urllib.parse import urljoin, quote as urlquote
+from tempfile import mkdtemp
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, quote as urlquote
 from ..errors import InternalError
 from ..paths import RUNTIMES
 from ..types import Env, RunnerSetupStatus, RunnerTestResults, RunnerUpdateStatus
@@ -97,6 +109,12 @@ PREFIX_BIN = PREFIX / "bin"
 
 MICROMAMBA_ROOT = RUNTIME_ROOT / "micromamba/"
 MICROMAMBA      = MICROMAMBA_ROOT / "bin/micromamba"
+MICROMAMBA_PKGS = MICROMAMBA_ROOT / "pkgs/"
+
+# Outside of MICROMAMBA_ROOT so they survive a `nextstrain setup --force`.
+MICROMAMBA_DISTRIBUTION_CACHE = RUNTIME_ROOT / "micromamba-distribution.json"
+MICROMAMBA_DOWNLOADS          = RUNTIME_ROOT / "micromamba-downloads/"
+MICROMAMBA_KEPT_PKGS          = RUNTIME_ROOT / "micromamba-pkgs/"
 
 # If you update the version pin below, please update the docstring above too.
 MICROMAMBA_VERSION = os.environ.get("NEXTSTRAIN_CONDA_MICROMAMBA_VERSION") \
@@ -108,8 +126,18 @@ NEXTSTRAIN_CHANNEL = os.environ.get("NEXTSTRAIN_CONDA_CHANNEL") \
 NEXTSTRAIN_BASE = os.environ.get("NEXTSTRAIN_CONDA_BASE_PACKAGE") \
                or "nextstrain-base"
 
+KEEP_PKGS = bool(os.environ.get("NEXTSTRAIN_CONDA_KEEP_PKGS"))
+
 PYTHONUSERBASE = RUNTIME_ROOT / "python-user-base"
 
+# Matches the channel URLs recorded in conda-meta/ for packages installed from
+# channels on anaconda.org, capturing the short channel name.
+ANACONDA_CHANNEL_URL = re.compile(r'^https://conda[.]anaconda[.]org/(?P<repo>.+?)/(?:linux|osx)-64$')
+
+# Deletions started by remove_tree() which are still running in the
+# background.  See wait_for_removals().
+BACKGROUND_REMOVALS: List[Tuple[Path, subprocess.Popen]] = []
+
 # Construct a PATH with our runtime prefix which provides some, but not total,
 # isolation from the rest of the system.
 PATH = os.pathsep.join(map(str, [
@@ -171,13 +199,20 @@ def run(opts, argv, working_volume = None, extra_env: Env = {}, cpus: int = None
 
 
 def setup(dry_run: bool = False, force: bool = False) -> RunnerSetupStatus:
-    if not setup_micromamba(dry_run, force):
-        return False
+    if not dry_run:
+        remove_leftover_trees(MICROMAMBA_ROOT)
+        remove_leftover_trees(PREFIX)
 
-    if not setup_prefix(dry_run, force):
-        return False
+    try:
+        if not setup_micromamba(dry_run, force):
+            return False
 
-    return True
+        if not setup_prefix(dry_run, force):
+            return False
+
+        return True
+    finally:
+        wait_for_removals()
 
 
 def setup_micromamba(dry_run: bool = False, force: bool = False) -> bool:
@@ -190,13 +225,25 @@ def setup_micromamba(dry_run: bool = False, force: bool = False) -> bool:
         return True
 
     if MICROMAMBA_ROOT.exists():
+        # Set the package cache aside, outside of MICROMAMBA_ROOT, so the new
+        # installation can reuse it.  If one's already set aside (e.g. by a
+        # previous setup that failed part way through), keep that one instead.
+        if KEEP_PKGS and MICROMAMBA_PKGS.is_dir() and not MICROMAMBA_KEPT_PKGS.exists():
+            print(f"Keeping existing package cache {MICROMAMBA_PKGS}…")
+            if not dry_run:
+                try:
+                    MICROMAMBA_PKGS.rename(MICROMAMBA_KEPT_PKGS)
+                except OSError as err:
+                    warn(f"Unable to keep existing package cache {MICROMAMBA_PKGS}: {err}")
+                    warn(f"Continuing anyway.")
+
         print(f"Removing existing directory {MICROMAMBA_ROOT} to start fresh…")
         if not dry_run:
-            shutil.rmtree(str(MICROMAMBA_ROOT))
+            remove_tree(MICROMAMBA_ROOT)
 
     # Query for Micromamba release
     try:
-        dist = package_distribution("conda-forge", "micromamba", MICROMAMBA_VERSION)
+        dist = micromamba_distribution(MICROMAMBA_VERSION, dry_run)
     except InternalError as err:
         warn(err)
         return False
@@ -207,34 +254,180 @@ def setup_micromamba(dry_run: bool = False, force: bool = False) -> bool:
     # that won't break if it starts including a scheme later.
     dist_url = urljoin("https:", dist["download_url"])
 
-    print(f"Requesting Micromamba from {dist_url}…")
-
     if not dry_run:
-        response = requests.get(dist_url, stream = True)
-        response.raise_for_status()
-        content_type = response.headers["Content-Type"]
-
-        assert content_type == "application/x-tar", \
-            f"unknown content-type for micromamba dist: {content_type}"
-
-        with tarfile.open(fileobj = response.raw, mode = "r|*") as tar: # type: ignore
-            # Ignore archive members starting with "/" and or including ".." parts,
-            # as these can be used (maliciously or accidentally) to overwrite
-            # unintended files (e.g. files outside of MICROMAMBA_ROOT).
-            safe_members = (
-                member
-                    for member in tar
-                     if not member.name.startswith("/")
-                    and ".." not in PurePosixPath(member.name).parts)
-
-            print(f"Downloading and extracting Micromamba to {MICROMAMBA_ROOT}…")
-            tar.extractall(path = str(MICROMAMBA_ROOT), members = safe_members)
+        try:
+            dist_file = download_micromamba_distribution(dist_url, dist.get("sha256"))
+        except (InternalError, requests.RequestException) as err:
+            warn(f"Unable to download Micromamba: {err}")
+
+            # The dist details may have come from our cache and be the cause
+            # (e.g. a download URL or checksum that's no longer valid), so
+            # forget them to make the next setup query anaconda.org afresh
+            # instead of failing the same way again.
+            try:
+                MICROMAMBA_DISTRIBUTION_CACHE.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as unlink_err:
+                warn(f"Unable to remove cached Micromamba distribution details in {MICROMAMBA_DISTRIBUTION_CACHE}: {unlink_err}")
+
+            return False
+
+        print(f"Extracting Micromamba to {MICROMAMBA_ROOT}…")
+
+        with tarfile.open(dist_file, mode = "r:*") as tar:
+            # Use tarfile's own "data" extraction filter when available
+            # (Python ≥3.12 and security backports to earlier versions).  It
+            # refuses to write outside of MICROMAMBA_ROOT, among other unsafe
+            # things, and does so without a per-member filter of our own.
+            if hasattr(tarfile, "data_filter"):
+                try:
+                    tar.extractall(path = str(MICROMAMBA_ROOT), filter = "data")
+                except tarfile.FilterError as err:
+                    warn(f"Refusing to extract unsafe Micromamba dist from {dist_url}: {err}")
+                    return False
+
+            else:
+                # Ignore archive members starting with "/" and or including ".." parts,
+                # as these can be used (maliciously or accidentally) to overwrite
+                # unintended files (e.g. files outside of MICROMAMBA_ROOT).
+                # Splitting on "/" finds the same ".." parts as
+                # PurePosixPath(…).parts without constructing a path object
+                # per member.
+                safe_members = (
+                    member
+                        for member in tar
+                         if not member.name.startswith("/")
+                        and ".." not in member.name.split("/"))
+
+                tar.extractall(path = str(MICROMAMBA_ROOT), members = safe_members)
+
+        # Put back any package cache set aside above (or by a previous setup).
+        if MICROMAMBA_KEPT_PKGS.exists() and not MICROMAMBA_PKGS.exists():
+            print(f"Restoring kept package cache to {MICROMAMBA_PKGS}…")
+            try:
+                MICROMAMBA_KEPT_PKGS.rename(MICROMAMBA_PKGS)
+            except OSError as err:
+                warn(f"Unable to restore kept package cache {MICROMAMBA_KEPT_PKGS}: {err}")
+                warn(f"Continuing anyway.")
     else:
+        print(f"Requesting Micromamba from {dist_url}…")
         print(f"Downloading and extracting Micromamba to {MICROMAMBA_ROOT}…")
 
     return True
 
 
+def download_micromamba_distribution(dist_url: str, sha256: Optional[str] = None) -> Path:
+    """
+    Download the Micromamba dist at *dist_url* into
+    ``MICROMAMBA_DOWNLOADS``, unless it's already there from a previous
+    setup, and return the path to the local file.
+
+    Dist file names include the version and build, so a file of the same name
+    is the same dist.  If *sha256* is given, it's used to verify both a
+    previously downloaded file (which is downloaded again on mismatch) and
+    the newly downloaded one (raising an :py:exc:`InternalError` on mismatch).
+    Only the most recently downloaded dist is kept.
+    """
+    dist_file = MICROMAMBA_DOWNLOADS / PurePosixPath(urlsplit(dist_url).path).name
+
+    if dist_file.exists() and (not sha256 or file_sha256(dist_file) == sha256):
+        print(f"Using previously downloaded Micromamba at {dist_file}.")
+        return dist_file
+
+    print(f"Requesting Micromamba from {dist_url}…")
+
+    response = requests.get(dist_url, stream = True)
+    response.raise_for_status()
+    content_type = response.headers["Content-Type"]
+
+    assert content_type == "application/x-tar", \
+        f"unknown content-type for micromamba dist: {content_type}"
+
+    print(f"Downloading Micromamba to {dist_file}…")
+
+    MICROMAMBA_DOWNLOADS.mkdir(parents = True, exist_ok = True)
+
+    # Download the whole archive to disk, reading from the network in large
+    # chunks, instead of letting tarfile issue many small, block-sized reads
+    # directly against the socket with extraction interleaved between them.
+    # Make sure we see the archive bytes themselves, not any transfer encoding
+    # applied on top.  Write to a temporary name first so an interrupted
+    # download is never mistaken for a complete one.
+    partial_file = dist_file.with_name(dist_file.name + ".partial")
+
+    with partial_file.open("wb") as file:
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, file, 1024 * 1024)
+
+    if sha256 and file_sha256(partial_file) != sha256:
+        partial_file.unlink()
+        raise InternalError(f"Downloaded Micromamba dist from {dist_url} doesn't match expected SHA-256 checksum {sha256}")
+
+    # Drop any previously downloaded dists, e.g. for other versions.  Anything
+    # else that's found its way into the directory is left alone, and not
+    # being able to clean up is no reason to fail setup.
+    for other_file in MICROMAMBA_DOWNLOADS.iterdir():
+        if other_file != partial_file and other_file.is_file():
+            try:
+                other_file.unlink()
+            except OSError as err:
+                warn(f"Unable to remove previously downloaded Micromamba {other_file}: {err}")
+
+    partial_file.replace(dist_file)
+
+    return dist_file
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the hex-encoded SHA-256 digest of the contents of file *path*.
+    """
+    digest = hashlib.sha256()
+
+    with path.open("rb") as file:
+        for chunk in iter(partial(file.read, 1024 * 1024), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def micromamba_distribution(version: str, dry_run: bool = False) -> Optional[dict]:
+    """
+    Query for the distribution of Micromamba *version* for this platform.
+
+    The distribution of a specific version doesn't change, so it's saved to
+    ``MICROMAMBA_DISTRIBUTION_CACHE`` and reused by subsequent setups instead
+    of querying anaconda.org again.  The special version ``latest`` is never
+    cached.  :py:func:`setup_micromamba` removes the cache if downloading the
+    distribution fails.
+    """
+    cacheable = version != "latest"
+
+    if cacheable:
+        try:
+            cached = json.loads(MICROMAMBA_DISTRIBUTION_CACHE.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+
+        if isinstance(cached, dict) \
+       and cached.get("version") == version \
+       and cached.get("attrs", {}).get("subdir") == platform_subdir():
+            return cached
+
+    dist = package_distribution("conda-forge", "micromamba", version)
+
+    if dist and cacheable and not dry_run:
+        try:
+            MICROMAMBA_DISTRIBUTION_CACHE.parent.mkdir(parents = True, exist_ok = True)
+            MICROMAMBA_DISTRIBUTION_CACHE.write_text(json.dumps(dist))
+        except OSError as err:
+            # Not being able to cache is no reason to fail setup.
+            warn(f"Unable to cache Micromamba distribution details in {MICROMAMBA_DISTRIBUTION_CACHE}: {err}")
+
+    return dist
+
+
 def setup_prefix(dry_run: bool = False, force: bool = False) -> bool:
     """
     Install Conda packages with Micromamba into our ``PREFIX``.
@@ -247,7 +440,7 @@ def setup_prefix(dry_run: bool = False, force: bool = False) -> bool:
     if PREFIX.exists():
         print(f"Removing existing directory {PREFIX} to start fresh…")
         if not dry_run:
-            shutil.rmtree(str(PREFIX))
+            remove_tree(PREFIX)
 
     # We accept a package match spec, which one to three space-separated parts.¹
     # If we got a spec, then we use it as-is.
@@ -279,18 +472,106 @@ def setup_prefix(dry_run: bool = False, force: bool = False) -> bool:
             return False
 
     # Clean up unnecessary caches
-    print("Cleaning up…")
+    if not KEEP_PKGS:
+        print("Cleaning up…")
 
-    if not dry_run:
-        try:
-            micromamba("clean", "--all", add_prefix = False)
-        except InternalError as err:
-            warn(err)
-            warn(f"Continuing anyway.")
+        if not dry_run:
+            try:
+                micromamba("clean", "--all", add_prefix = False)
+            except InternalError as err:
+                warn(err)
+                warn(f"Continuing anyway.")
 
     return True
 
 
+def remove_tree(path: Path) -> None:
+    """
+    Recursively delete the directory *path*, like :py:func:`shutil.rmtree`,
+    but without waiting for the deletion to finish when possible.
+
+    On POSIX systems, *path* is first moved aside into a new sibling directory,
+    which is quick, and then that directory is deleted in the background by
+    the system's ``rm -rf``, which is much faster than :py:func:`shutil.rmtree`
+    for trees of many small files, like our Conda env with its tens of
+    thousands of files.  This lets setup proceed immediately instead of
+    blocking on the deletion.  Use :py:func:`wait_for_removals` to wait for
+    background deletions to finish.
+
+    Falls back to a synchronous :py:func:`shutil.rmtree` elsewhere or if
+    ``rm`` isn't available.  Like :py:func:`shutil.rmtree`, refuses to remove
+    a symlink, raising an :py:exc:`OSError`.
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+
+    # If *path* is a symlink (e.g. to put the runtime on a bigger disk),
+    # moving it aside and deleting that would remove only the link and
+    # silently orphan everything it points to.  Let rmtree() refuse it loudly
+    # instead, as it always has.
+    if not rm or path.is_symlink():
+        shutil.rmtree(str(path))
+        return
+
+    # Moving into a fresh directory, rather than renaming to a fixed name,
+    # avoids colliding with leftovers from an earlier, interrupted removal.
+    trash = Path(mkdtemp(prefix = f"{path.name}.old-", dir = str(path.parent)))
+
+    try:
+        path.rename(trash / path.name)
+    except:
+        trash.rmdir()
+        raise
+
+    remove_in_background(rm, trash)
+
+
+def remove_leftover_trees(path: Path) -> None:
+    """
+    Delete, in the background, any directories left beside *path* by earlier
+    calls to :py:func:`remove_tree` whose deletion didn't finish (e.g. because
+    it was killed).
+    """
+    rm = shutil.which("rm") if os.name == "posix" else None
+
+    if not rm:
+        return
+
+    for leftover in path.parent.glob(f"{path.name}.old-*"):
+        if leftover.is_dir():
+            remove_in_background(rm, leftover)
+
+
+def remove_in_background(rm: str, path: Path) -> None:
+    """
+    Start deleting *path* with *rm* (``rm -rf``) in the background.
+    """
+    # Start a new session so that a ^C to us doesn't also interrupt the
+    # deletion part way through.
+    process = subprocess.Popen(
+        [rm, "-rf", "--", str(path)],
+        stdin = subprocess.DEVNULL,
+        start_new_session = True)
+
+    BACKGROUND_REMOVALS.append((path, process))
+
+
+def wait_for_removals() -> None:
+    """
+    Wait for any background deletions started by :py:func:`remove_tree` or
+    :py:func:`remove_leftover_trees` to finish, warning about any that failed.
+    """
+    while BACKGROUND_REMOVALS:
+        trash, process = BACKGROUND_REMOVALS.pop(0)
+
+        # Deleting a whole Conda env can take a while, so don't leave the user
+        # wondering why we haven't exited yet.
+        if process.poll() is None:
+            print(f"Waiting for removal of {trash} to finish…")
+
+        if process.wait() != 0:
+            warn(f"Unable to completely remove {trash}.  The next `nextstrain setup conda` will try again, or you can remove it yourself.")
+
+
 def micromamba(*args, add_prefix: bool = True) -> None:
     """
     Runs our installed Micromamba with appropriate global options and options
@@ -307,7 +588,7 @@ def micromamba(*args, add_prefix: bool = True) -> None:
     ``--prefix`` option and channel-related options which are otherwise
     automatically added.
     """
-    argv = tuple(map(str, (
+    argv = list(map(str, (
         MICROMAMBA,
 
         # Always use our custom root
@@ -324,7 +605,7 @@ def micromamba(*args, add_prefix: bool = True) -> None:
     )))
 
     if add_prefix:
-        argv += (
+        argv += [
             # Path-based env
             "--prefix", str(PREFIX),
 
@@ -346,7 +627,7 @@ def micromamba(*args, add_prefix: bool = True) -> None:
             # explicit here.
             "--allow-uninstall",
             "--allow-downgrade",
-        )
+        ]
 
     env = {
         # Filter out all CONDA_* and MAMBA_* host env vars so micromamba's
@@ -369,8 +650,8 @@ def micromamba(*args, add_prefix: bool = True) -> None:
         #
         # ¹ <https://github.com/nextstrain/cli/pull/223#issuecomment-1270806302>
         **{ k: v
-            for k, v in os.environ.copy().items()
-             if not any(k.startswith(p) for p in {"CONDA_", "MAMBA_"}) },
+            for k, v in os.environ.items()
+             if not k.startswith(("CONDA_", "MAMBA_")) },
 
         # Set env vars to match options above for subprocesses that micromamba
         # itself launches.  We can't include MAMBA_NO_ENV because that would
@@ -433,39 +714,34 @@ def test_setup() -> RunnerTestResults:
              "Try running `nextstrain setup conda` first.", False),
         ]
 
+    def installed_and_runnable(cmd) -> bool:
+        return which_finds_our(cmd) and runnable(cmd, "--version")
+
+    # Each of these probes pays the startup cost of an entire Python or
+    # Node.js program, so run them concurrently instead of one after another.
+    with ThreadPoolExecutor(max_workers = 3) as executor:
+        snakemake, augur, auspice = executor.map(installed_and_runnable, ["snakemake", "augur", "auspice"])
+
     return [
         *support,
         ("runtime appears set up", True),
 
-        ('snakemake is installed and runnable',
-            which_finds_our("snakemake") and runnable("snakemake", "--version")),
+        ('snakemake is installed and runnable', snakemake),
 
-        ('augur is installed and runnable',
-            which_finds_our("augur") and runnable("augur", "--version")),
+        ('augur is installed and runnable', augur),
 
-        ('auspice is installed and runnable',
-            which_finds_our("auspice") and runnable("auspice", "--version")),
+        ('auspice is installed and runnable', auspice),
     ]
 
 
 def test_support() -> RunnerTestResults:
     def supported_os() -> bool:
-        machine = platform.machine()
-        system = platform.system()
-
-        if system == "Linux":
-            return machine == "x86_64"
-
-        # Note even on arm64 (e.g. aarch64, Apple Silicon M1) we use x86_64
-        # binaries because of current ecosystem compatibility, but Rosetta will
-        # make it work.
-        elif system == "Darwin":
-            return machine in {"x86_64", "arm64"}
-
-        # Conda supports Windows, but we can't because several programs we need
-        # are not available for Windows.
-        else:
+        try:
+            platform_subdir()
+        except InternalError:
             return False
+        else:
+            return True
 
     return [
         ('operating system is supported',
@@ -533,31 +809,49 @@ def update() -> RunnerUpdateStatus:
         return False
 
     # Clean up unnecessary caches
-    print("Cleaning up…")
-    try:
-        micromamba("clean", "--all", add_prefix = False)
-    except InternalError as err:
-        warn(err)
-        warn(f"Continuing anyway.")
+    if not KEEP_PKGS:
+        print("Cleaning up…")
+        try:
+            micromamba("clean", "--all", add_prefix = False)
+        except InternalError as err:
+            warn(err)
+            warn(f"Continuing anyway.")
 
     return True
 
 
 def versions() -> Iterable[str]:
-    try:
-        yield package_version(NEXTSTRAIN_BASE)
-    except OSError:
-        pass
+    # Prefer the versions recorded in the env's package metadata, which are
+    # the same ones the programs report, over starting up each program just
+    # to ask it.
+    def installed_version(name: str) -> Optional[str]:
+        version = (package_meta(name) or {}).get("version")
+        return f"{name} {version}" if version else None
+
+    def augur_version() -> str:
+        return installed_version("augur") \
+            or capture_output([str(PREFIX_BIN / "augur"), "--version"])[0]
+
+    def auspice_version() -> str:
+        return installed_version("auspice") \
+            or "auspice " + capture_output([str(PREFIX_BIN / "auspice"), "--version"])[0]
+
+    # Augur and Auspice are each a whole Python or Node.js program to start
+    # up, so if we do have to ask them, ask both at once instead of one after
+    # the other.
+    with ThreadPoolExecutor(max_workers = 2) as executor:
+        program_versions = [executor.submit(augur_version), executor.submit(auspice_version)]
 
-    try:
-        yield capture_output([str(PREFIX_BIN / "augur"), "--version"])[0]
-    except (OSError, subprocess.CalledProcessError):
-        pass
+        try:
+            yield package_version(NEXTSTRAIN_BASE)
+        except OSError:
+            pass
 
-    try:
-        yield "auspice " + capture_output([str(PREFIX_BIN / "auspice"), "--version"])[0]
-    except (OSError, subprocess.CalledProcessError):
-        pass
+        for program_version in program_versions:
+            try:
+                yield program_version.result()
+            except (OSError, subprocess.CalledProcessError):
+                pass
 
 
 def package_version(spec: str) -> str:
@@ -571,7 +865,7 @@ def package_version(spec: str) -> str:
     build   = meta.get("build",   "unknown")
     channel = meta.get("channel", "unknown")
 
-    anaconda_channel = re.search(r'^https://conda[.]anaconda[.]org/(?P<repo>.+?)/(?:linux|osx)-64$', channel)
+    anaconda_channel = ANACONDA_CHANNEL_URL.search(channel)
 
     if anaconda_channel:
         channel = anaconda_channel["repo"]
@@ -581,40 +875,67 @@ def package_version(spec: str) -> str:
 
 def package_meta(spec: str) -> Optional[dict]:
     name = package_name(spec)
-    metafile = next((PREFIX / "conda-meta").glob(f"{name}-*.json"), None)
+
+    # Metadata files are named <name>-<version>-<build>.json.  Package names
+    # may contain hyphens, but versions and build strings can't, so split from
+    # the right to find the name.  Scan the directory ourselves and stop at the
+    # first match instead of globbing, which both matches every entry against
+    # a pattern and would match other packages whose names share our prefix
+    # (e.g. "augur-*.json" also matches "augur-extras-1.0-0.json").
+    def is_metafile(entry: os.DirEntry) -> bool:
+        stem, ext = os.path.splitext(entry.name)
+        return ext == ".json" and stem.rsplit("-", 2)[0] == name
+
+    try:
+        with os.scandir(PREFIX / "conda-meta") as entries:
+            metafile = next((Path(entry.path) for entry in entries if is_metafile(entry)), None)
+    except FileNotFoundError:
+        return None
 
     if not metafile:
         return None
 
+    return read_package_metafile(metafile, metafile.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize = None)
+def read_package_metafile(metafile: Path, mtime_ns: int) -> dict:
+    """
+    Parse the conda-meta JSON file *metafile*.
+
+    Memoized so repeated lookups of the same package within a process don't
+    parse the file again.  *mtime_ns* is part of the cache key so that a file
+    rewritten by an install or update is parsed anew.
+
+    Callers should treat the returned dict as read-only, as it's shared.
+    """
     return json.loads(metafile.read_bytes())
 
 
-def package_distribution(channel: str, package: str, version: str = None, label: str = "main") -> Optional[dict]:
+def package_distribution(channel: str, package: str, version: str = None, label: str = "main", http: requests.Session = None) -> Optional[dict]:
     # If *package* is a package spec, convert it just to a name.
     package = package_name(package)
 
+    # Both API requests below go to the same host, so make them over the same
+    # session to reuse its connection instead of setting up a new one (and
+    # TLS) for each.
+    if http is None:
+        with requests.Session() as http:
+            return package_distribution(channel, package, version, label, http)
+
     if version is None:
-        version = latest_package_label_version(channel, package, label)
+        version = latest_package_label_version(channel, package, label, http)
         if version is None:
             warn(f"Could not find latest version of package {package!r} with label {label!r}.",
                  "\nUsing 'latest' version instead, which will be the latest version of the package regardless of label.")
             version = "latest"
 
-    response = requests.get(f"https://api.anaconda.org/release/{urlquote(channel)}/{urlquote(package)}/{urlquote(version)}")
+    response = http.get(f"https://api.anaconda.org/release/{urlquote(channel)}/{urlquote(package)}/{urlquote(version)}")
     response.raise_for_status()
 
     dists = response.json().get("distributions", [])
 
-    system = platform.system()
-    machine = platform.machine()
-
-    if (system, machine) == ("Linux", "x86_64"):
-        subdir = "linux-64"
-    elif (system, machine) in {("Darwin", "x86_64"), ("Darwin", "arm64")}:
-        # Use the x86 arch even on arm (https://docs.nextstrain.org/en/latest/reference/faq.html#why-intel-miniconda-installer-on-apple-silicon)
-        subdir = "osx-64"
-    else:
-        raise InternalError(f"Unsupported system/machine: {system}/{machine}")
+    subdir = platform_subdir()
 
     # Releases have other attributes related to system/machine, but they're
     # informational-only and subdir is what Conda *actually* uses to
@@ -626,19 +947,57 @@ def package_distribution(channel: str, package: str, version: str = None, label:
     return dist
 
 
+@lru_cache(maxsize = None)
+def platform_subdir() -> str:
+    """
+    Conda subdir (e.g. ``linux-64``) to use for the current system/machine.
+
+    Raises an :py:exc:`InternalError` if the system/machine isn't supported.
+    """
+    system = platform.system()
+    machine = platform.machine()
+
+    if (system, machine) == ("Linux", "x86_64"):
+        return "linux-64"
+
+    # Note even on arm64 (e.g. aarch64, Apple Silicon M1) we use x86_64
+    # binaries because of current ecosystem compatibility, but Rosetta will
+    # make it work.  See also <https://docs.nextstrain.org/en/latest/reference/faq.html#why-intel-miniconda-installer-on-apple-silicon>.
+    elif (system, machine) in {("Darwin", "x86_64"), ("Darwin", "arm64")}:
+        return "osx-64"
+
+    # Conda supports Windows, but we can't because several programs we need
+    # are not available for Windows.
+    else:
+        raise InternalError(f"Unsupported system/machine: {system}/{machine}")
+
+
 def package_name(spec: str) -> str:
     return PackageSpec.parse(spec).name
 
 
-def latest_package_label_version(channel: str, package: str, label: str) -> Optional[str]:
-    response = requests.get(f"https://api.anaconda.org/package/{urlquote(channel)}/{urlquote(package)}/files")
+def latest_package_label_version(channel: str, package: str, label: str, http: requests.Session = None) -> Optional[str]:
+    if http is None:
+        with requests.Session() as http:
+            return latest_package_label_version(channel, package, label, http)
+
+    response = http.get(f"https://api.anaconda.org/package/{urlquote(channel)}/{urlquote(package)}/files")
     response.raise_for_status()
 
-    label_files = (file for file in response.json() if label in file.get("labels", []))
-    # Default '0-dev' should be the lowest version according to PEP440
-    # See https://peps.python.org/pep-0440/#summary-of-permitted-suffixes-and-relative-ordering
-    latest_file: dict = max(label_files, default={}, key=lambda file: parse_version(file.get('version', '0-dev')))
-    return latest_file.get("version")
+    # Each version is listed once per file, i.e. once per platform and build,
+    # so collect the distinct versions first and parse each only once.  Keep
+    # them in the API's order (dicts preserve insertion order, sets don't) so
+    # that when different version strings parse as equal (e.g. "1.0" and
+    # "1.0.0"), max() picks the first listed, same as when it went over every
+    # file.  Files without a version can't be the latest unless there are no
+    # others, in which case there's no latest version to return anyway.
+    label_versions = dict.fromkeys(
+        file["version"]
+            for file in response.json()
+             if label in file.get("labels", [])
+            and "version" in file)
+
+    return max(label_versions, default = None, key = parse_version)
 
 
 def parse_version(version: str) -> Version:
@@ -706,21 +1065,26 @@ class PackageSpec(NamedTuple):
     version_spec: Optional[str] = None
     build_id: Optional[str] = None
 
+    # Specs are parsed from the same handful of strings (i.e. NEXTSTRAIN_BASE)
+    # over and over during a run, so parse each only once.
     @staticmethod
+    @lru_cache(maxsize = None)
     def parse(spec):
         """
         Splits a `Conda package match spec`_ into a tuple of (name, version_spec, build_id).
 
         Returns a :cls:`PackageSpec`.
 
+        >>> PackageSpec.parse("nextstrain-base")
+        PackageSpec(name='nextstrain-base', version_spec=None, build_id=None)
+        >>> PackageSpec.parse("nextstrain-base ==20230615T171309Z")
+        PackageSpec(name='nextstrain-base', version_spec='==20230615T171309Z', build_id=None)
+        >>> PackageSpec.parse("nextstrain-base ==20230615T171309Z h4bc722e_0")
+        PackageSpec(name='nextstrain-base', version_spec='==20230615T171309Z', build_id='h4bc722e_0')
+
         .. _Conda package match spec: https://docs.conda.io/projects/conda/en/latest/user-guide/concepts/pkg-specs.html#package-match-specifications
         """
         parts = spec.split(maxsplit = 2)
 
-        try:
-            return PackageSpec(parts[0], parts[1], parts[2])
-        except IndexError:
-            try:
-                return PackageSpec(parts[0], parts[1], None)
-            except IndexError:
-                return PackageSpec(parts[0], None, None)
+        # The tuple's missing trailing fields default to None.
+        return PackageSpec(*parts)
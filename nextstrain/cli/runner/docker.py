@@ -76,10 +76,13 @@ defaults set by `config file variables`_.
 
 import os
 import json
+import platform
 import requests
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path, PurePosixPath
 from tempfile import TemporaryDirectory
 from textwrap import dedent
@@ -162,6 +165,19 @@ def run(opts, argv, working_volume = None, extra_env: Env = {}, cpus: int = None
     uid = getattr(os, "getuid", lambda: None)()
     gid = getattr(os, "getgid", lambda: None)()
 
+    # On macOS, bind mounts cross from the host into Docker Desktop's VM,
+    # which can make file access within them very slow.  Relax the
+    # consistency guarantees between host and container so the container can
+    # cache what it reads.  Host files *are* commonly modified while the
+    # container runs (e.g. edited during `nextstrain shell`, or still being
+    # written by a build while `nextstrain view` serves them), and "cached"
+    # is acceptable only because the delay before the container sees such
+    # changes is brief.  Don't relax this further (e.g. to "delegated", which
+    # delays the host seeing the container's writes) without accounting for
+    # that.  Docker ignores this on other platforms and on newer Docker
+    # Desktop file sharing implementations which don't need it.
+    volume_options = ",cached" if platform.system() == "Darwin" else ""
+
     # If the image supports /nextstrain/env.d, then pass any env vars using it
     # so values aren't visible in the container's config (e.g. visible via
     # `docker inspect`).
@@ -212,7 +228,7 @@ def run(opts, argv, working_volume = None, extra_env: Env = {}, cpus: int = None
         *(["--user=%d:%d" % (uid, gid)] if uid and gid else []),
 
         # Map directories to bind mount into the container.
-        *["--volume=%s:%s:%s" % (v.src.resolve(strict = True), mount_point(v), "rw" if v.writable else "ro")
+        *["--volume=%s:%s:%s%s" % (v.src.resolve(strict = True), mount_point(v), "rw" if v.writable else "ro", volume_options)
             for v in opts.volumes
              if v.src is not None],
 
@@ -241,10 +257,11 @@ def assert_volumes_exist(volumes: Iterable[NamedVolume]):
     # doesn't match up well with our use case.  We're aiming to not surprise or
     # confuse the user.
     #
+    # A directory that passes is_dir() necessarily exists, so there's no need
+    # to also stat() it again with exists().
     missing_volumes = [
         vol for vol in volumes
-             if (vol.dir and not vol.src.is_dir())
-             or not vol.src.exists() ]
+             if (not vol.src.is_dir() if vol.dir else not vol.src.exists()) ]
 
     if missing_volumes:
         raise UserError("""
@@ -298,7 +315,7 @@ def test_setup() -> RunnerTestResults:
     def test_run():
         try:
             status = subprocess.run(
-                ["docker", "run", "--rm", "hello-world"],
+                ["docker", "run", "--rm", "--network=none", "hello-world"],
                 check = True,
                 stdout = subprocess.DEVNULL)
         except:
@@ -376,24 +393,30 @@ def test_setup() -> RunnerTestResults:
         # If we're using the "latest" tag and the image doesn't yet exist
         # locally, then the most recent image will be pulled down the first
         # time its needed.  Presumably this will be new enough for the CLI.
-        elif tag == "latest" and not image_exists(DEFAULT_IMAGE):
+        elif tag == "latest" and not image_exists():
             status = True
 
         return [(msg, status)]
 
-    return [
-        ('docker is installed',
-            shutil.which("docker") is not None),
-        ('docker run works',
-            test_run()),
-        *test_memory_limit(),
-        *test_image_version(),
-
-        # Rosetta 2 is optional, so convert False (fail) → None (warning)
-        *[(msg, None if status is False else status)
-            for msg, status
-             in test_rosetta_enabled("Rosetta 2 is enabled for faster execution (optional)")],
-    ]
+    # Each of these starts up a container, so run them concurrently instead
+    # of one after another.
+    with ThreadPoolExecutor(max_workers = 2) as executor:
+        run_works = executor.submit(test_run)
+        memory_limit = executor.submit(test_memory_limit)
+
+        return [
+            ('docker is installed',
+                shutil.which("docker") is not None),
+            ('docker run works',
+                run_works.result()),
+            *memory_limit.result(),
+            *test_image_version(),
+
+            # Rosetta 2 is optional, so convert False (fail) → None (warning)
+            *[(msg, None if status is False else status)
+                for msg, status
+                 in test_rosetta_enabled("Rosetta 2 is enabled for faster execution (optional)")],
+        ]
 
 
 def set_default_config() -> None:
@@ -429,6 +452,8 @@ def _update(dry_run: bool = False) -> RunnerUpdateStatus:
                 check = True)
         except (OSError, subprocess.CalledProcessError):
             return False
+        finally:
+            image_exists.cache_clear()
 
         # Update the config file to point to the new image so we use it by default
         # going forward.
@@ -444,8 +469,16 @@ def _update(dry_run: bool = False) -> RunnerUpdateStatus:
 
     if not dry_run:
         try:
-            images = dangling_images(latest_image) \
-                   + old_build_images(latest_image)
+            # Both listings are separate round-trips through the Docker CLI
+            # and daemon, so make them concurrently.  They both must come
+            # after the pull, though, as it's the pull that leaves the
+            # previous image of a mutable tag (e.g. "latest") dangling.
+            with ThreadPoolExecutor(max_workers = 2) as executor:
+                dangling = executor.submit(dangling_images, latest_image)
+                old_builds = executor.submit(old_build_images, latest_image)
+
+                images = dangling.result() \
+                       + old_builds.result()
 
             if images:
                 subprocess.run(
@@ -461,6 +494,8 @@ def _update(dry_run: bool = False) -> RunnerUpdateStatus:
             warn()
             warn("Not to worry, we'll try again the next time you run `nextstrain update`.")
             warn()
+        finally:
+            image_exists.cache_clear()
 
     return True
 
@@ -486,11 +521,15 @@ def is_build_tag(tag: str) -> bool:
     return tag.startswith("build-")
 
 
+@lru_cache(maxsize = None)
 def latest_build_image(image_name: str) -> str:
     """
     Query the Docker registry for the latest image tagged "build-*" in the
     given *image_name*'s repository.
 
+    Results are cached for the life of the process, as e.g. ``nextstrain
+    setup`` asks both when updating and when setting the default config.
+
     Our "latest" tag always has a "build-*" counterpart.  Using a "build-*" tag
     is better than using the "latest" tag since the former is more descriptive
     and points to a static snapshot instead of a mutable snapshot.
@@ -554,10 +593,10 @@ def latest_build_image(image_name: str) -> str:
     repository, tag = split_image_name(image_name, implicit_latest = False)
 
     if not tag or is_build_tag(tag):
-        build_tags = sorted(filter(is_build_tag, tags(repository)))
+        latest_build_tag = max(filter(is_build_tag, tags(repository)), default = None)
 
-        if build_tags:
-            return repository + ":" + build_tags[-1]
+        if latest_build_tag:
+            return repository + ":" + latest_build_tag
 
     return image_name
 
@@ -688,16 +727,24 @@ def run_bash(script: str, image: str = DEFAULT_IMAGE) -> List[str]:
     Run a Bash *script* inside of the container *image*.
 
     Returns the output of the script as a list of strings.
+
+    The container has no network access, which saves setting up networking
+    for it.  Scripts run with this are quick local probes that don't need it.
     """
     return capture_output([
-        "docker", "run", "--rm", image,
+        "docker", "run", "--rm", "--network=none", image,
             "bash", "-c", script
     ])
 
 
+@lru_cache(maxsize = None)
 def image_exists(image: str = DEFAULT_IMAGE) -> bool:
     """
     Check if a Docker *image* exists locally, returning True or False.
+
+    Results are cached, as each check is a round-trip through the Docker CLI
+    and daemon and some commands (e.g. ``check-setup``) ask more than once.
+    :py:func:`_update` clears the cache after pulling or removing images.
     """
     try:
         subprocess.run(
@@ -0,0 +1,55 @@
+import json
+from nextstrain.cli.runner import conda
+
+
+def pytest_package_meta_exact_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(conda, "PREFIX", tmp_path)
+
+    conda_meta = tmp_path / "conda-meta"
+    conda_meta.mkdir()
+
+    (conda_meta / "augur-extras-1.0-0.json").write_text(json.dumps({"name": "augur-extras", "version": "1.0"}))
+    assert conda.package_meta("augur") is None
+
+    (conda_meta / "augur-24.0.0-pyhdfd78af_0.json").write_text(json.dumps({"name": "augur", "version": "24.0.0"}))
+    assert conda.package_meta("augur") == {"name": "augur", "version": "24.0.0"}
+    assert conda.package_meta("augur-extras") == {"name": "augur-extras", "version": "1.0"}
+
+
+def pytest_latest_package_label_version():
+    class Response:
+        def __init__(self, files):
+            self.files = files
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return self.files
+
+    class Session:
+        def __init__(self, files):
+            self.files = files
+
+        def get(self, url):
+            return Response(self.files)
+
+    def latest(files, label = "main"):
+        return conda.latest_package_label_version("nextstrain", "nextstrain-base", label, Session(files))
+
+    files = [
+        {"version": "1.0", "labels": ["main"]},
+        {"version": "2.0", "labels": ["main"]},
+        {"version": "2.0", "labels": ["main"]},
+        {"version": "3.0", "labels": ["dev"]},
+        {"labels": ["main"]},
+    ]
+
+    assert latest(files) == "2.0"
+    assert latest(files, "dev") == "3.0"
+    assert latest(files, "nope") is None
+    assert latest([{"labels": ["main"]}]) is None
+
+    # Versions which parse as equal resolve to the first one listed.
+    assert latest([{"version": "1.0.0", "labels": ["main"]}, {"version": "1.0", "labels": ["main"]}]) == "1.0.0"
+    assert latest([{"version": "1.0", "labels": ["main"]}, {"version": "1.0.0", "labels": ["main"]}]) == "1.0"